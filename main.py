@@ -1,13 +1,19 @@
 import sys
 import os
 import time
+import math
 import tempfile
+import wave
 import shutil
+import hashlib
+import glob
 from typing import List, Tuple
+from collections import OrderedDict
 import json
 import re
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -16,20 +22,42 @@ import pyqtgraph as pg
 import numpy as np
 from pydub import AudioSegment
 
+try:
+	import av  # PyAV：进程内解码，可选
+except ImportError:
+	av = None
+
+try:
+	from numba import njit, prange  # 波形降采样 JIT，可选
+except ImportError:
+	njit = None
+
 SUPPORTED_EXTS = {'.mp3', '.wav', '.flac', '.ogg', '.aac', '.m4a'}
+_AUDIO_SUFFIXES = tuple(SUPPORTED_EXTS)  # for a single str.endswith call
+
+# pydub sample_width -> NumPy dtype of the signed little-endian PCM in AudioSegment._data
+_SW_DTYPE = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# 波形显示的桶数（每桶两个点），与屏幕像素宽度同一量级
+WAVEFORM_POINTS = 4000
+
+# 跨合并复用的解码缓存上限（按 PCM 字节数计）
+DECODE_CACHE_MAX_BYTES = 512 * 1024 * 1024
 
 # App versioning and GitHub repo info (replace with your repo)
 APP_VERSION = '1.0'
 GITHUB_REPO = 'LJB123779/audio'  # e.g., 'octocat/Hello-World'
+_VERSION_NUM_RE = re.compile(r'\d+')
 
 # Silence marker helpers for targeted insertion
 SILENCE_MARKER_PREFIX = '__SILENCE__:('
+_SILENCE_RE = re.compile(re.escape(SILENCE_MARKER_PREFIX) + r'([0-9]+)\)')
+
+def _match_silence_marker(entry: str):
+	return _SILENCE_RE.fullmatch(entry) if isinstance(entry, str) else None
 
 def is_silence_marker(entry: str) -> bool:
-	try:
-		return isinstance(entry, str) and entry.startswith(SILENCE_MARKER_PREFIX) and entry.endswith(')')
-	except Exception:
-		return False
+	return _match_silence_marker(entry) is not None
 
 def make_silence_marker(duration_ms: int) -> str:
 	if duration_ms < 0:
@@ -37,12 +65,8 @@ def make_silence_marker(duration_ms: int) -> str:
 	return f"{SILENCE_MARKER_PREFIX}{int(duration_ms)})"
 
 def parse_silence_marker_ms(entry: str) -> int:
-	if not is_silence_marker(entry):
-		return 0
-	try:
-		return int(entry[len(SILENCE_MARKER_PREFIX):-1])
-	except Exception:
-		return 0
+	m = _match_silence_marker(entry)
+	return int(m.group(1)) if m else 0
 
 # UI display helpers
 def _format_seconds_from_ms(ms: int) -> str:
@@ -56,21 +80,116 @@ def _format_seconds_from_ms(ms: int) -> str:
 		return '0s'
 
 def to_display_text(entry: str) -> str:
-	if is_silence_marker(entry):
-		ms = parse_silence_marker_ms(entry)
-		return f"静音{_format_seconds_from_ms(ms)}"
+	m = _match_silence_marker(entry)
+	if m:
+		return f"静音{_format_seconds_from_ms(int(m.group(1)))}"
 	return os.path.basename(entry)
 
+def _decode_pyav(path: str) -> AudioSegment:
+	"""用 PyAV 在进程内解码为 16-bit PCM，避免每个文件启动一次 ffmpeg；不可用或解码失败时回退到 pydub"""
+	if av is None:
+		return AudioSegment.from_file(path)
+	try:
+		with av.open(path) as container:
+			stream = container.streams.audio[0]
+			channels = len(stream.layout.channels)
+			# 统一重采样为交错的 s16，planar / float 格式由 libswresample 负责换算
+			resampler = av.AudioResampler(format='s16', layout=stream.layout, rate=stream.rate)
+			chunks = []
+			for frame in container.decode(stream):
+				for out in resampler.resample(frame):
+					chunks.append(out.to_ndarray())
+			for out in resampler.resample(None):
+				chunks.append(out.to_ndarray())
+			data = np.concatenate(chunks, axis=1).astype(np.int16, copy=False).tobytes() if chunks else b''
+			return AudioSegment(data, sample_width=2, frame_rate=stream.rate, channels=channels)
+	except (av.error.FFmpegError, IndexError):
+		return AudioSegment.from_file(path)
+
+if njit is not None:
+	@njit(parallel=True, fastmath=True, cache=True)
+	def _peak_downsample_jit(x, bucket, out_min, out_max):
+		# 一次遍历同时求每桶的最小/最大值，桶之间并行
+		for i in prange(out_min.shape[0]):
+			s = i * bucket
+			lo = x[s]
+			hi = x[s]
+			for j in range(1, bucket):
+				v = x[s + j]
+				if v < lo:
+					lo = v
+				elif v > hi:
+					hi = v
+			out_min[i] = lo
+			out_max[i] = hi
+else:
+	_peak_downsample_jit = None
+
+def downsample_peaks(samples: np.ndarray, target: int = WAVEFORM_POINTS) -> Tuple[np.ndarray, int]:
+	"""将样本分成 target 个桶，交错输出每桶的最小/最大值；返回 (数据, 每桶样本数)，无需降采样时每桶为 1"""
+	bucket = len(samples) // target
+	if bucket < 2:
+		return samples, 1
+	out = np.empty(2 * target, dtype=samples.dtype)
+	if _peak_downsample_jit is not None:
+		_peak_downsample_jit(samples, bucket, out[0::2], out[1::2])
+	else:
+		view = samples[:target * bucket].reshape(target, bucket)
+		out[0::2] = view.min(axis=1)
+		out[1::2] = view.max(axis=1)
+	return out, bucket
+
+def write_wav(path: str, seg: AudioSegment):
+	"""直接把 PCM 写成 WAV（标准库 wave，不经过 ffmpeg）"""
+	data = seg._data
+	if seg.sample_width == 1:
+		# WAV 的 8-bit 为无符号，pydub 内部为有符号
+		data = (np.frombuffer(data, dtype=np.uint8) ^ 0x80).tobytes()
+	with wave.open(path, 'wb') as w:
+		w.setnchannels(seg.channels)
+		w.setsampwidth(seg.sample_width)
+		w.setframerate(seg.frame_rate)
+		w.writeframesraw(data)
+
+
+class DecodeCache:
+	"""(abspath, mtime_ns, size) -> 解码后的 AudioSegment 的 LRU 缓存，按 PCM 总字节数限额；
+	合并串行执行，只在工作线程中读写"""
+
+	def __init__(self, max_bytes: int = DECODE_CACHE_MAX_BYTES):
+		self.max_bytes = max_bytes
+		self._items: OrderedDict = OrderedDict()
+		self._total_bytes = 0
+
+	def get(self, key: tuple) -> AudioSegment:
+		seg = self._items.get(key)
+		if seg is not None:
+			self._items.move_to_end(key)
+		return seg
+
+	def put(self, key: tuple, seg: AudioSegment):
+		"""写入缓存，超出限额时从最久未用的条目开始淘汰"""
+		old = self._items.pop(key, None)
+		if old is not None:
+			self._total_bytes -= len(old._data)
+		self._items[key] = seg
+		self._total_bytes += len(seg._data)
+		while self._total_bytes > self.max_bytes and len(self._items) > 1:
+			_, evicted = self._items.popitem(last=False)
+			self._total_bytes -= len(evicted._data)
+
 
 class MergeWorkerThread(QtCore.QThread):
 	# 信号定义
 	progress_updated = QtCore.pyqtSignal(int)  # 进度更新 (0-100)
-	merge_completed = QtCore.pyqtSignal(object, np.ndarray, np.ndarray)  # (merged_audio, x_data, y_data)
+	merge_completed = QtCore.pyqtSignal(object, np.ndarray, float)  # (merged_audio, y_data, 每个点对应的秒数)
 	merge_error = QtCore.pyqtSignal(str)  # 错误信息
 	
-	def __init__(self, file_list: List[str]):
+	def __init__(self, file_list: List[str], decode_cache: DecodeCache = None):
 		super().__init__()
 		self.file_list = file_list
+		# 跨多次合并复用的解码缓存
+		self.decode_cache = decode_cache if decode_cache is not None else DecodeCache()
 		self._cancel_requested = False
 	
 	def cancel(self):
@@ -78,69 +197,137 @@ class MergeWorkerThread(QtCore.QThread):
 	
 	def run(self):
 		try:
-			merged = None
-			total_files = len(self.file_list)
-			
+			# 并行解码所有音频文件（PyAV 不可用时每个文件都是一个 ffmpeg 子进程），按列表顺序收集结果；
+			# 静音标记只记录时长，统一格式后一次性拼接
+			keys = {}
 			for idx, f in enumerate(self.file_list):
-				if self._cancel_requested:
-					return
-				
-				# 更新进度
-				progress = int((idx / total_files) * 80)  # 合并占80%进度
-				self.progress_updated.emit(progress)
+				if not is_silence_marker(f):
+					st = os.stat(f)
+					keys[idx] = (os.path.abspath(f), st.st_mtime_ns, st.st_size)
+			
+			# 缓存命中（文件未改动）的直接复用，同一文件重复出现只解码一次
+			resolved = {}
+			for key in keys.values():
+				seg = self.decode_cache.get(key)
+				if seg is not None:
+					resolved[key] = seg
+			pending = [key for key in dict.fromkeys(keys.values()) if key not in resolved]
+			# 完成回调在线程池中执行，只做 list.append；进度统一由本线程发出，保证单调且取消后不再发信号
+			decoded = []
+			reported = 0
+			
+			def report_progress():
+				# 解码占80%进度
+				nonlocal reported
+				if len(decoded) != reported:
+					reported = len(decoded)
+					self.progress_updated.emit(int(reported / len(pending) * 80))
+			
+			entries = []
+			executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+			try:
+				futures = {}
+				for key in pending:
+					future = executor.submit(_decode_pyav, key[0])
+					future.add_done_callback(decoded.append)
+					futures[key] = future
 				
-				# If this entry is a silence marker, insert targeted silence and continue
-				if is_silence_marker(f):
-					marker_ms = parse_silence_marker_ms(f)
-					if marker_ms > 0:
-						if merged is None:
-							merged = AudioSegment.silent(duration=marker_ms)
-						else:
-							merged += AudioSegment.silent(duration=marker_ms)
-					continue
-
-				# Regular audio file
-				seg = AudioSegment.from_file(f)
-				if merged is None:
-					merged = seg
-				else:
-					merged += seg
+				for idx, f in enumerate(self.file_list):
+					# Silence markers are kept as durations and rendered once the target format is known
+					if idx not in keys:
+						marker_ms = parse_silence_marker_ms(f)
+						if marker_ms > 0:
+							entries.append(marker_ms)
+						continue
+					
+					# Regular audio file; poll so a cancel request is noticed while decoding
+					key = keys[idx]
+					if key not in resolved:
+						future = futures[key]
+						while not future.done():
+							if self._cancel_requested:
+								return
+							futures_wait([future], timeout=0.1)
+							report_progress()
+						report_progress()
+						resolved[key] = future.result()
+						self.decode_cache.put(key, resolved[key])
+					entries.append(resolved[key])
+			finally:
+				executor.shutdown(wait=False, cancel_futures=True)
 			
 			if self._cancel_requested:
 				return
 			
+			# Same target format as pydub's own `+` (max of rate/width/channels), but
+			# concatenated once instead of re-copying the accumulated audio per file
+			segments = [e for e in entries if isinstance(e, AudioSegment)]
+			if segments:
+				frame_rate = max(seg.frame_rate for seg in segments)
+				sample_width = max(seg.sample_width for seg in segments)
+				channels = max(seg.channels for seg in segments)
+			else:
+				frame_rate, sample_width, channels = 11025, 2, 1  # AudioSegment.silent defaults
+			frame_width = sample_width * channels
+			
+			# 静音直接生成目标格式的零字节（按整帧对齐），相同时长只生成一次
+			silence_chunks = {}
+			chunks = []
+			for e in entries:
+				if isinstance(e, AudioSegment):
+					seg = e.set_frame_rate(frame_rate).set_sample_width(sample_width).set_channels(channels)
+					chunks.append(seg._data)
+				else:
+					if e not in silence_chunks:
+						silence_chunks[e] = bytes(e * frame_rate // 1000 * frame_width)
+					chunks.append(silence_chunks[e])
+			
+			# 按已知总长度一次性分配输出缓冲区，逐块拷入；拷完即释放格式转换产生的临时数据以降低峰值内存
+			buf = bytearray(sum(len(c) for c in chunks))
+			with memoryview(buf) as mv:
+				off = 0
+				for i, c in enumerate(chunks):
+					mv[off:off + len(c)] = c
+					off += len(c)
+					chunks[i] = None
+			merged = AudioSegment(buf, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+			
 			# 处理音频数据用于波形显示 (占剩余20%进度)
 			self.progress_updated.emit(85)
 			
 			sample_width = merged.sample_width
 			channels = merged.channels
 			frame_rate = merged.frame_rate
-			raw = np.array(merged.get_array_of_samples())
+			raw = np.frombuffer(merged._data, dtype=_SW_DTYPE[sample_width])  # zero-copy view
 			
 			if self._cancel_requested:
 				return
 			
 			self.progress_updated.emit(90)
 			
+			# 峰值用 min/max 求得（不生成 abs 临时数组），归一化与转 float32 合并为一次运算
 			if channels > 1:
-				raw = raw.reshape((-1, channels))
-				raw = raw.mean(axis=1)
-			
-			raw = raw.astype(np.float32)
-			max_val = np.max(np.abs(raw)) or 1.0
-			raw /= max_val
+				raw = raw.reshape((-1, channels)).mean(axis=1, dtype=np.float32)
+				peak = float(max(-raw.min(), raw.max())) if raw.size else 0.0
+				raw *= np.float32(1.0 / (peak or 1.0))
+			else:
+				peak = max(-int(raw.min()), int(raw.max())) if raw.size else 0
+				raw = np.multiply(raw, np.float32(1.0 / (peak or 1)), dtype=np.float32)
 			
 			if self._cancel_requested:
 				return
 			
 			self.progress_updated.emit(95)
 			
-			x = np.linspace(0, len(raw) / frame_rate, num=len(raw))
+			# 波形只需屏幕宽度量级的点数：按桶取最小/最大值保留峰值轮廓
+			# x 轴不生成数组，只传每个点对应的秒数（最小/最大值交错，每桶两个点）
+			raw, bucket = downsample_peaks(raw)
+			x_scale = bucket / 2 / frame_rate if bucket > 1 else 1 / frame_rate
 			
 			self.progress_updated.emit(100)
 			
 			# 发送完成信号
-			self.merge_completed.emit(merged, x, raw)
+			self.merge_completed.emit(merged, raw, x_scale)
 			
 		except Exception as e:
 			self.merge_error.emit(str(e))
@@ -175,10 +362,33 @@ class UpdateCheckThread(QtCore.QThread):
 			self.error.emit(str(ex))
 
 
+def _is_audio_name(name: str) -> bool:
+	# 与 os.path.splitext 一致：'.mp3' 这类只有前导点的文件名没有扩展名
+	return name.lower().endswith(_AUDIO_SUFFIXES) and '.' in name.lstrip('.')
+
+
 def is_audio_file(path: str) -> bool:
-	_, ext = os.path.splitext(path)
-	ext = ext.lower()
-	return ext in SUPPORTED_EXTS
+	return _is_audio_name(os.path.basename(path))
+
+
+def _iter_audio_files(root: str):
+	"""列出目录树中的音频文件，顺序与 os.walk 相同（先本层文件，再依次进入子目录）。
+	用显式栈代替递归；只对 DirEntry.name 做后缀判断，不拼接路径"""
+	stack = [root]
+	while stack:
+		subdirs = []
+		try:
+			with os.scandir(stack.pop()) as it:
+				for entry in it:
+					# 与 os.walk 相同：指向目录的符号链接算作目录，但不进入
+					if entry.is_dir():
+						if entry.is_dir(follow_symlinks=False):
+							subdirs.append(entry.path)
+					elif _is_audio_name(entry.name):
+						yield entry.path
+		except OSError:
+			continue
+		stack.extend(reversed(subdirs))
 
 
 class DraggableListWidget(QtWidgets.QListWidget):
@@ -207,12 +417,8 @@ class DraggableListWidget(QtWidgets.QListWidget):
 		for url in urls:
 			path = url.toLocalFile()
 			if os.path.isdir(path):
-				for root, _, files in os.walk(path):
-					for name in files:
-						full = os.path.join(root, name)
-						if is_audio_file(full):
-							dropped_paths.append(full)
-			elif os.path.isfile(path) and is_audio_file(path):
+				dropped_paths.extend(_iter_audio_files(path))
+			elif is_audio_file(path) and os.path.isfile(path):
 				dropped_paths.append(path)
 		if dropped_paths:
 			self.filesDropped.emit(dropped_paths)
@@ -230,8 +436,16 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		self.file_list: List[str] = []
 		# removed global between-all silence control; use targeted markers only
 		self.merged: AudioSegment = None
+		# 合并结果的交错 PCM 视图（零拷贝），供音量条按播放位置切片
+		self._pcm: np.ndarray = None
+		self._pcm_frame_rate = 0
+		self._pcm_channels = 0
 		self.preview_path: str = ''
+		# 上次合并结果对应的列表摘要，以及正在进行的合并的摘要
+		self._last_merge_key = ''
+		self._pending_merge_key = ''
 		self.position_ms = 0
+		self._fmt_ms_cache = {}  # 秒 -> 'mm:ss'
 		self._timer = QtCore.QTimer(self)
 		self._timer.setInterval(50)
 		self._timer.timeout.connect(self._on_timer_tick)
@@ -240,6 +454,8 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		# 工作线程和进度对话框
 		self.merge_worker = None
 		self.progress_dialog = None
+		# 解码缓存：再次合并（如仅调整静音）时未改动的文件无需重新解码
+		self._decode_cache = DecodeCache()
 
 		# settings
 		self.settings = QtCore.QSettings('audio2', 'audio_merger')
@@ -252,6 +468,8 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		# Qt 媒体播放器用于预览
 		self.player = QMediaPlayer(self)
 		self.player.setVolume(100)
+		# positionChanged 默认每秒一次；与计时器同频，进度条与时间只由它驱动
+		self.player.setNotifyInterval(50)
 		self.player.positionChanged.connect(self._on_player_position)
 		self.player.durationChanged.connect(self._on_player_duration)
 		self.player.stateChanged.connect(self._on_player_state)
@@ -386,29 +604,15 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		self._update_thread.start()
 
 	@staticmethod
-	def _normalize_version_text(text: str) -> str:
-		if not text:
-			return '0.0.0'
-		# 去掉前缀 'v' 等，并提取数字与点
-		text = text.strip()
-		if text.lower().startswith('v'):
-			text = text[1:]
-		parts = re.findall(r'\d+', text)
-		if not parts:
-			return '0.0.0'
-		return '.'.join(parts)
-
-	@staticmethod
-	def _version_tuple(ver: str) -> Tuple[int, int, int, int]:
-		parts = [int(p) for p in ver.split('.') if p.isdigit()]
-		# pad to length 4 for safe comparison
-		while len(parts) < 4:
-			parts.append(0)
-		return tuple(parts[:4])  # type: ignore
+	def _version_tuple(text: str) -> Tuple[int, int, int, int]:
+		# 直接提取数字段（忽略 'v' 前缀等），pad to length 4 for safe comparison
+		parts = [int(p) for p in _VERSION_NUM_RE.findall(text or '')[:4]]
+		parts += [0] * (4 - len(parts))
+		return tuple(parts)  # type: ignore
 
 	def _is_remote_newer(self, local: str, remote: str) -> bool:
-		lv = self._version_tuple(self._normalize_version_text(local))
-		rv = self._version_tuple(self._normalize_version_text(remote))
+		lv = self._version_tuple(local)
+		rv = self._version_tuple(remote)
 		return rv > lv
 
 	def _on_update_success(self, info: dict):
@@ -443,17 +647,22 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 			self._update_thread = None
 
 	def _on_files_dropped(self, paths: List[str]):
-		for p in paths:
-			self.file_list.append(p)
-			self.list_widget.addItem(to_display_text(p))
+		self._append_entries(paths)
+
+	def _append_entries(self, entries: List[str]):
+		# 一次性插入，插入期间暂停重绘，避免大量文件时逐条刷新卡住界面
+		self.list_widget.setUpdatesEnabled(False)
+		try:
+			self.file_list.extend(entries)
+			self.list_widget.addItems([to_display_text(e) for e in entries])
+		finally:
+			self.list_widget.setUpdatesEnabled(True)
 
 	def _on_add_files(self):
 		files, _ = QtWidgets.QFileDialog.getOpenFileNames(
 			self, '选择音频文件', os.path.expanduser('~'),
 			'音频文件 (*.mp3 *.wav *.flac *.ogg *.aac *.m4a)')
-		for f in files:
-			self.file_list.append(f)
-			self.list_widget.addItem(to_display_text(f))
+		self._append_entries(files)
 
 	def _on_remove_selected(self):
 		for item in self.list_widget.selectedItems():
@@ -474,14 +683,19 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		duration_ms = int(round(duration_sec * 1000))
 		# Sort descending by row
 		rows = sorted([idx.row() for idx in selected], reverse=True)
-		for row in rows:
-			marker = make_silence_marker(duration_ms)
-			self.file_list.insert(row + 1, marker)
-			self.list_widget.insertItem(row + 1, to_display_text(marker))
-		# Keep selection on original items
-		self.list_widget.clearSelection()
-		for row in rows:
-			self.list_widget.item(row).setSelected(True)
+		marker = make_silence_marker(duration_ms)
+		marker_text = to_display_text(marker)
+		self.list_widget.setUpdatesEnabled(False)
+		try:
+			for row in rows:
+				self.file_list.insert(row + 1, marker)
+				self.list_widget.insertItem(row + 1, marker_text)
+			# Keep selection on original items
+			self.list_widget.clearSelection()
+			for row in rows:
+				self.list_widget.item(row).setSelected(True)
+		finally:
+			self.list_widget.setUpdatesEnabled(True)
 
 	def _on_clear(self):
 		self.list_widget.clear()
@@ -532,27 +746,48 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		if self.progress_dialog:
 			self.progress_dialog.setValue(value)
 	
-	def _on_merge_completed(self, merged_audio: AudioSegment, x_data: np.ndarray, y_data: np.ndarray):
+	def _on_merge_completed(self, merged_audio: AudioSegment, y_data: np.ndarray, x_scale: float):
 		"""合并完成处理"""
 		try:
-			# 更新波形显示
-			self.wave_plot.setData(x_data, y_data)
+			# 更新波形显示（x 为点序号，由坐标轴缩放换算成秒）
+			self.wave_plot.setData(y_data)
+			self.plot_widget.getAxis('bottom').setScale(x_scale)
 			self.plot_widget.setLabel('bottom', '时间', units='s')
 			self.plot_widget.setYRange(-1.05, 1.05)
 			
 			self.merged = merged_audio
+			self._pcm = np.frombuffer(merged_audio._data, dtype=_SW_DTYPE[merged_audio.sample_width])
+			self._pcm_frame_rate = merged_audio.frame_rate
+			self._pcm_channels = merged_audio.channels
 			self.position_ms = 0
 			self.seek_slider.setRange(0, int(len(self.merged)))
 			self._update_time_label()
 			
-			# 生成预览 WAV 并载入播放器
+			# 生成预览 WAV 并载入播放器；文件名带列表摘要，相同内容的预览已在磁盘上时直接复用。
+			# 只有预览成功载入后才记录摘要、切换路径并删除旧预览，失败时下次点击合并会重新生成
 			tmp_dir = tempfile.gettempdir()
-			self.preview_path = os.path.join(tmp_dir, 'audio2_preview.wav')
+			preview_path = os.path.join(tmp_dir, f'audio2_preview_{self._pending_merge_key}.wav')
+			# 先写临时文件再改名，避免中断时留下不完整的预览被当作可复用
+			partial_path = preview_path + '.part'
 			try:
-				self.merged.export(self.preview_path, format='wav')
-				self.player.setMedia(QMediaContent(QtCore.QUrl.fromLocalFile(self.preview_path)))
+				if not os.path.exists(preview_path):
+					write_wav(partial_path, self.merged)
+					os.replace(partial_path, preview_path)
+				self.player.setMedia(QMediaContent(QtCore.QUrl.fromLocalFile(preview_path)))
 			except Exception as ex:
+				try:
+					os.remove(partial_path)
+				except OSError:
+					pass
+				# 旧预览已与当前合并结果不符，卸载它但保留文件
+				self.player.setMedia(QMediaContent())
+				self.preview_path = ''
+				self._last_merge_key = ''
 				QtWidgets.QMessageBox.warning(self, '提示', f'生成预览文件失败：{ex}')
+			else:
+				self.preview_path = preview_path
+				self._last_merge_key = self._pending_merge_key
+				self._prune_previews(tmp_dir, keep=preview_path)
 			
 			QtWidgets.QMessageBox.information(self, '成功', '合并完成，可预览或导出。')
 		finally:
@@ -563,6 +798,32 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		QtWidgets.QMessageBox.critical(self, '错误', f'合并失败：{error_msg}')
 		self._cleanup_merge_operation()
 
+	@staticmethod
+	def _prune_previews(tmp_dir: str, keep: str):
+		"""删除临时目录中除 keep 外的预览文件（含以前会话遗留的），磁盘上最多保留一份预览；
+		仍被占用而删除失败的文件留到下次再清理"""
+		for path in glob.glob(os.path.join(tmp_dir, 'audio2_preview*')):
+			if path != keep:
+				try:
+					os.remove(path)
+				except OSError:
+					pass
+
+	def _merge_key(self) -> str:
+		"""文件列表（含各文件的修改时间与大小）的摘要，用于判断合并结果与预览文件能否复用"""
+		# 解码器影响输出 PCM（PyAV 统一为 16-bit，pydub 保留 24/32-bit），一并计入摘要
+		parts = [('decoder', 'pyav' if av is not None else 'pydub')]
+		for f in self.file_list:
+			if is_silence_marker(f):
+				parts.append(f)
+				continue
+			try:
+				st = os.stat(f)
+				parts.append((f, st.st_mtime_ns, st.st_size))
+			except OSError:
+				parts.append(f)
+		return hashlib.blake2b(repr(parts).encode('utf-8')).hexdigest()[:16]
+
 	def _on_merge(self):
 		if not self.file_list:
 			QtWidgets.QMessageBox.warning(self, '提示', '请先添加音频文件')
@@ -574,6 +835,14 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		if self.merge_worker and self.merge_worker.isRunning():
 			return
 		
+		# 列表与文件均未变化且预览文件仍在时，上次的合并结果与预览仍然有效
+		merge_key = self._merge_key()
+		if (self.merged is not None and merge_key == self._last_merge_key
+				and self.preview_path and os.path.exists(self.preview_path)):
+			QtWidgets.QMessageBox.information(self, '提示', '文件列表未变化，当前已是最新的合并结果。')
+			return
+		self._pending_merge_key = merge_key
+		
 		# 禁用UI控件
 		self._set_ui_enabled(False)
 		
@@ -582,7 +851,7 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		self.progress_dialog.show()
 		
 		# 创建并启动工作线程
-		self.merge_worker = MergeWorkerThread(self.file_list.copy())
+		self.merge_worker = MergeWorkerThread(self.file_list.copy(), self._decode_cache)
 		self.merge_worker.progress_updated.connect(self._on_merge_progress)
 		self.merge_worker.merge_completed.connect(self._on_merge_completed)
 		self.merge_worker.merge_error.connect(self._on_merge_error)
@@ -647,15 +916,14 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		self._update_time_label()
 
 	def _on_timer_tick(self):
-		if self.merged is None:
+		if self._pcm is None:
 			return
-		self.position_ms = int(self.player.position())
-		self._update_seek_visuals()
-		try:
-			chunk = self.merged[max(0, self.position_ms - 50):self.position_ms]
-			self._update_volume_meter(chunk)
-		except Exception:
-			pass
+		# 进度条与时间由 positionChanged 驱动，计时器只负责音量条
+		pos = int(self.player.position())
+		# 最近 50ms 的样本，按整帧对齐直接切 NumPy 视图
+		start = max(0, pos - 50) * self._pcm_frame_rate // 1000 * self._pcm_channels
+		end = pos * self._pcm_frame_rate // 1000 * self._pcm_channels
+		self._update_volume_meter(self._pcm[start:end])
 
 	def _on_set_ffmpeg(self):
 		start_dir = os.path.dirname(self.ffmpeg_path) if self.ffmpeg_path else os.path.expanduser('~')
@@ -726,6 +994,8 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 				self._timer.stop()
 
 	def _update_seek_visuals(self):
+		if self.seek_slider.value() == int(self.position_ms):
+			return
 		self.seek_slider.blockSignals(True)
 		self.seek_slider.setValue(int(self.position_ms))
 		self.seek_slider.blockSignals(False)
@@ -736,24 +1006,28 @@ class AudioMergerApp(QtWidgets.QMainWindow):
 		total = self._format_ms(int(len(self.merged)) if self.merged is not None else 0)
 		self.lbl_time.setText(f'{cur} / {total}')
 
-	@staticmethod
-	def _format_ms(ms: int) -> str:
+	def _format_ms(self, ms: int) -> str:
+		# 计时器 20Hz 调用，同一秒内直接复用已格式化的文本；
+		# 当前位置与总时长交替调用，所以按秒缓存而不是只记上一次
 		sec = ms // 1000
-		m = sec // 60
-		s = sec % 60
-		return f'{m:02d}:{s:02d}'
-
-	def _update_volume_meter(self, chunk: AudioSegment):
-		arr = np.array(chunk.get_array_of_samples()).astype(np.float32)
-		if chunk.channels > 1:
-			arr = arr.reshape((-1, chunk.channels)).mean(axis=1)
-		# RMS normalized to 0..100 range
-		if arr.size == 0:
+		text = self._fmt_ms_cache.get(sec)
+		if text is None:
+			if len(self._fmt_ms_cache) >= 4096:
+				self._fmt_ms_cache.clear()
+			text = f'{sec // 60:02d}:{sec % 60:02d}'
+			self._fmt_ms_cache[sec] = text
+		return text
+
+	def _update_volume_meter(self, raw: np.ndarray):
+		# RMS over all channel samples relative to full scale, mapped to 0..100
+		if raw.size == 0:
 			value = 0
 		else:
-			rms = np.sqrt(np.mean(np.square(arr)))
-			peak = np.max(np.abs(arr)) or 1.0
-			value = int(min(100, (rms / peak) * 100))
+			# float64 keeps the sum of squares exact enough and cannot overflow for 32-bit samples
+			arr = raw.astype(np.float64)
+			rms = math.sqrt(np.dot(arr, arr) / arr.size)
+			full_scale = float(np.iinfo(raw.dtype).max) + 1.0
+			value = int(min(100, rms / full_scale * 100))
 		self.volume_bar.setValue(value)
 
 